@@ -1,7 +1,15 @@
-from typing import Union, Any, get_type_hints
+from typing import Optional, Union, Any, get_type_hints
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import gc
+import json
+import time
+import weakref
 import pytest
+import typed_params
 from typed_params import (
     BaseModel,
+    FastBaseModel,
     load_params_dict_from_json_file,
     raise_error_with_location,
 )
@@ -19,6 +27,11 @@ class MockParams(BaseModel):
     TEST_SUBOBJECT: MockSubObject
 
 
+class MockTreeNode(BaseModel):
+    NAME: str
+    CHILDREN: list["MockTreeNode"]
+
+
 @pytest.fixture
 def params_dict():
     return load_params_dict_from_json_file("./tests/test_data/mock_params.json")
@@ -29,6 +42,46 @@ def mock_params(params_dict) -> MockParams:
     return MockParams(params_dict)
 
 
+def test_load_params_dict_from_json_file_without_orjson(monkeypatch, params_dict):
+    monkeypatch.setattr(typed_params, "orjson", None)
+
+    assert (
+        load_params_dict_from_json_file("./tests/test_data/mock_params.json")
+        == params_dict
+    )
+
+
+@pytest.mark.parametrize(
+    "params_json, parsed_by_orjson",
+    [
+        ('{"NAN": NaN, "INFINITY": Infinity}', False),
+        ('{"BIG_INT": 123456789012345678901234567890}', False),
+        ('{"BIG_NEGATIVE_INT": -9223372036854775809}', False),
+        (
+            '{"FLOATS": [0.0021060533511106927, 1.2345678901234567e-05, -0.5]}',
+            True,
+        ),
+    ],
+)
+def test_load_params_dict_from_json_file_matches_json(
+    monkeypatch, tmp_path, params_json, parsed_by_orjson
+):
+    params_file = tmp_path / "params.json"
+    params_file.write_text(params_json)
+    expected_dict = json.loads(params_json)
+
+    if parsed_by_orjson and typed_params.orjson is not None:
+
+        def fail_json_loads(*args, **kwargs):
+            raise AssertionError("orjson should have been used")
+
+        monkeypatch.setattr(typed_params.json, "loads", fail_json_loads)
+
+    actual_dict = load_params_dict_from_json_file(params_file)
+
+    assert repr(actual_dict) == repr(expected_dict)
+
+
 def test_params_correctly_sets_basic_types(mock_params, params_dict):
     assert mock_params.TEST_STRING == params_dict["TEST_STRING"]
     assert mock_params.TEST_INT == params_dict["TEST_INT"]
@@ -57,6 +110,52 @@ def test_params_repr_method(mock_params):
     assert "(MockParams Location: > MockParams)" == repr(mock_params)
 
 
+def test_params_str_method_for_subobjects(params_dict):
+    class ClassWithDictOfSubObjects(BaseModel):
+        DICT_SUBOBJECTS: dict[str, MockParams]
+
+    params_with_subobjects = ClassWithDictOfSubObjects(
+        {"DICT_SUBOBJECTS": {"SUBOBJECT_1": params_dict}}
+    )
+    subobject = params_with_subobjects.DICT_SUBOBJECTS["SUBOBJECT_1"]
+
+    assert (
+        "(MockSubObject Location: > ClassWithDictOfSubObjects > DICT_SUBOBJECTS"
+        " > Key SUBOBJECT_1 > MockParams > MockSubObject)"
+    ) == str(subobject.TEST_SUBOBJECT)
+
+
+def test_subobjects_do_not_keep_parent_alive(params_dict):
+    gc.disable()
+    try:
+        params = MockParams(params_dict)
+        sub_object = params.TEST_SUBOBJECT
+        params_reference = weakref.ref(params)
+        del params
+
+        assert params_reference() is None
+        assert "(MockSubObject Location: > MockParams > MockSubObject)" == str(
+            sub_object
+        )
+    finally:
+        gc.enable()
+
+
+def test_params_location_tracker_can_be_set(params_dict):
+    class ParamsWithCustomLocation(MockParams):
+        def __init__(self, params_dict, location_tracker="") -> None:
+            self._location_tracker = " > Custom location"
+            self.set_params_from_params_dict(params_dict)
+
+    params = ParamsWithCustomLocation(params_dict)
+
+    assert "(ParamsWithCustomLocation Location: > Custom location)" == str(params)
+    assert (
+        "(MockSubObject Location: > Custom location > MockSubObject)"
+        == str(params.TEST_SUBOBJECT)
+    )
+
+
 def test_params_equality(mock_params, params_dict):
     assert mock_params == MockParams(params_dict)
 
@@ -66,6 +165,15 @@ def test_params_inequality(mock_params, params_dict):
     assert mock_params != MockParams(params_dict)
 
 
+def test_params_equality_with_itself(mock_params):
+    assert mock_params == mock_params
+
+
+def test_params_are_not_hashable(mock_params):
+    with pytest.raises(TypeError):
+        hash(mock_params)
+
+
 def test_subclass_inequality(mock_params, params_dict):
     class ClassWithSameAttributes(BaseModel):
         TEST_STRING: str
@@ -89,6 +197,92 @@ def test_check_param_being_loaded_is_in_type_definition_raises_error(
     assert "Location: > MockParams" in str(err.value)
 
 
+def test_init_sets_attributes_inherited_from_parent_class(params_dict):
+    class ChildParams(MockParams):
+        TEST_CHILD_STRING: str
+
+    params_dict["TEST_CHILD_STRING"] = "child_string"
+    child_params = ChildParams(params_dict)
+
+    assert child_params.TEST_STRING == params_dict["TEST_STRING"]
+    assert child_params.TEST_CHILD_STRING == "child_string"
+
+
+def test_init_resolves_forward_references():
+    tree_node = MockTreeNode(
+        {"NAME": "root", "CHILDREN": [{"NAME": "leaf", "CHILDREN": []}]}
+    )
+
+    assert tree_node.CHILDREN == [MockTreeNode({"NAME": "leaf", "CHILDREN": []})]
+
+
+def test_init_with_non_class_type_hints():
+    class ClassWithNonClassTypeHints(BaseModel):
+        OPTIONAL_STRING: Optional[str]
+        ANYTHING: Any
+        LIST_OF_UNIONS: list[Union[str, int]]
+
+    non_class_params_dict = {
+        "OPTIONAL_STRING": None,
+        "ANYTHING": {"KEY": "VALUE"},
+        "LIST_OF_UNIONS": ["1", 2],
+    }
+
+    assert (
+        ClassWithNonClassTypeHints(non_class_params_dict).to_dict()
+        == non_class_params_dict
+    )
+
+
+def test_init_with_slots(params_dict: dict[str, Any]):
+    class MockSlotsSubObject(BaseModel):
+        __slots__ = ("STRING_1",)
+        STRING_1: str
+
+    class MockSlotsParams(BaseModel):
+        __slots__ = ("TEST_STRING", "SUBOBJECT_LIST")
+        TEST_STRING: str
+        SUBOBJECT_LIST: list[MockSlotsSubObject]
+
+    slots_params_dict = {
+        "TEST_STRING": params_dict["TEST_STRING"],
+        "SUBOBJECT_LIST": [{"STRING_1": "some_string"}],
+    }
+    slots_params = MockSlotsParams(slots_params_dict)
+
+    assert not hasattr(slots_params, "__dict__")
+    assert slots_params.to_dict() == {
+        "TEST_STRING": params_dict["TEST_STRING"],
+        "SUBOBJECT_LIST": [MockSlotsSubObject({"STRING_1": "some_string"})],
+    }
+    assert slots_params == MockSlotsParams(slots_params_dict)
+
+
+def test_init_with_slots_and_missing_attribute_raises_error():
+    class MockSlotsSubObject(BaseModel):
+        __slots__ = ("STRING_1",)
+        STRING_1: str
+
+    with pytest.raises(ValueError) as err:
+        MockSlotsSubObject({})
+
+    assert "The attribute STRING_1 is missing from the params object" in str(err.value)
+
+
+def test_init_skips_unknown_param_when_check_is_overridden(
+    params_dict: dict[str, Any]
+):
+    class ParamsThatWarn(MockParams):
+        def _check_param_being_loaded_is_in_type_definition(self, param_name) -> None:
+            pass
+
+    params_dict["NOT_IN_TYPE_DEFINITION"] = "some_string"
+    params_that_warn = ParamsThatWarn(params_dict)
+
+    assert not hasattr(params_that_warn, "NOT_IN_TYPE_DEFINITION")
+    assert params_that_warn.TEST_STRING == params_dict["TEST_STRING"]
+
+
 def test_init_with_no_attributes_raises_error(params_dict: dict[str, Any]):
     class ClassWithNoAttributes(BaseModel):
         pass
@@ -120,6 +314,35 @@ def test_init_subobject_with_no_attributes_raises_error():
     )
 
 
+def test_init_with_missing_attribute_raises_error(params_dict: dict[str, Any]):
+    del params_dict["TEST_INT"]
+
+    with pytest.raises(ValueError) as err:
+        MockParams(params_dict)
+
+    assert "The attribute TEST_INT is missing from the params object" in str(err.value)
+    assert "Location: > MockParams" in str(err.value)
+
+
+def test_init_with_several_missing_attributes_raises_error_for_first(
+    params_dict: dict[str, Any]
+):
+    del params_dict["TEST_LIST"]
+    del params_dict["TEST_INT"]
+
+    with pytest.raises(ValueError) as err:
+        MockParams(params_dict)
+
+    assert "The attribute TEST_INT is missing from the params object" in str(err.value)
+
+
+def test_init_allows_missing_attribute_with_default(params_dict: dict[str, Any]):
+    class ClassWithDefault(MockParams):
+        TEST_DEFAULT: str = "default"
+
+    assert ClassWithDefault(params_dict).TEST_DEFAULT == "default"
+
+
 def test_check_param_being_loaded_is_in_type_definition_for_subobject_raises_error(
     params_dict: dict[str, Any]
 ):
@@ -170,6 +393,48 @@ def test_check_param_being_loaded_is_in_type_definition_for_dict_of_subobject_ra
     )
 
 
+def test_run_validations_for_list_of_subobjects():
+    class SubObjectWithValidation(BaseModel):
+        STRING_1: str
+
+        def run_validations(self) -> None:
+            if self.STRING_1 != "some_string":
+                raise ValueError(f"Invalid STRING_1 Location:{self._location_tracker}")
+
+    class ClassWithListOfSubObjects(BaseModel):
+        LIST_SUBOBJECTS: list[SubObjectWithValidation]
+
+    invalid_subobject_list_params = {
+        "LIST_SUBOBJECTS": [{"STRING_1": "some_string"}, {"STRING_1": "invalid"}]
+    }
+
+    with pytest.raises(ValueError) as err:
+        ClassWithListOfSubObjects(invalid_subobject_list_params)
+
+    assert (
+        "Location: > ClassWithListOfSubObjects > LIST_SUBOBJECTS > Element 1"
+        " > SubObjectWithValidation" in str(err.value)
+    )
+
+
+def test_list_of_subobjects_uses_overridden_init():
+    class SubObjectWithInit(BaseModel):
+        STRING_1: str
+
+        def __init__(self, params_dict, location_tracker="") -> None:
+            super().__init__(params_dict, location_tracker)
+            self.STRING_1 = self.STRING_1.upper()
+
+    class ClassWithListOfSubObjects(BaseModel):
+        LIST_SUBOBJECTS: list[SubObjectWithInit]
+
+    params_with_subobjects = ClassWithListOfSubObjects(
+        {"LIST_SUBOBJECTS": [{"STRING_1": "some_string"}]}
+    )
+
+    assert params_with_subobjects.LIST_SUBOBJECTS[0].STRING_1 == "SOME_STRING"
+
+
 def test_convert_typed_subparams_to_objects_for_singular_subobject(
     mock_params: MockParams,
 ):
@@ -314,3 +579,238 @@ def test_raise_error_with_location():
 
     assert error_message in str(err.value)
     assert location in str(err.value)
+
+
+requires_msgspec = pytest.mark.skipif(
+    typed_params.msgspec is None, reason="msgspec is not installed"
+)
+
+if typed_params.msgspec is not None:
+
+    class MockFastTreeNode(FastBaseModel):
+        NAME: str
+        CHILDREN: list["MockFastTreeNode"]
+
+
+@requires_msgspec
+def test_fast_base_model_sets_params():
+    class MockFastSubObject(FastBaseModel):
+        STRING_1: str
+
+    class MockFastParams(FastBaseModel):
+        TEST_STRING: str
+        TEST_INT: int
+        TEST_SUBOBJECT: MockFastSubObject
+        LIST_SUBOBJECTS: list[MockFastSubObject]
+        DICT_SUBOBJECTS: dict[str, MockSubObject]
+
+    fast_params = MockFastParams(
+        {
+            "TEST_STRING": "TEST_STRING",
+            "TEST_INT": 1,
+            "TEST_SUBOBJECT": {"STRING_1": "some_string"},
+            "LIST_SUBOBJECTS": [{"STRING_1": "some_string"}],
+            "DICT_SUBOBJECTS": {"SUBOBJECT_1": {"STRING_1": "some_string"}},
+        }
+    )
+    sub_object = MockFastSubObject({"STRING_1": "some_string"})
+
+    assert fast_params.TEST_STRING == "TEST_STRING"
+    assert fast_params.TEST_INT == 1
+    assert fast_params.TEST_SUBOBJECT == sub_object
+    assert fast_params.LIST_SUBOBJECTS == [sub_object]
+    assert fast_params.DICT_SUBOBJECTS == {
+        "SUBOBJECT_1": MockSubObject({"STRING_1": "some_string"})
+    }
+    assert (
+        "(MockFastSubObject Location: > MockFastParams > LIST_SUBOBJECTS > Element 0"
+        " > MockFastSubObject)"
+    ) == str(fast_params.LIST_SUBOBJECTS[0])
+
+
+@requires_msgspec
+def test_fast_base_model_subobjects_use_overridden_init():
+    class SubObjectWithInit(BaseModel):
+        STRING_1: str
+
+        def __init__(self, params_dict, location_tracker="") -> None:
+            super().__init__(params_dict, location_tracker)
+            self.STRING_1 = self.STRING_1.upper()
+
+    class MockFastParams(FastBaseModel):
+        SUBOBJECT: SubObjectWithInit
+        LIST_SUBOBJECTS: list[SubObjectWithInit]
+
+    fast_params = MockFastParams(
+        {
+            "SUBOBJECT": {"STRING_1": "some_string"},
+            "LIST_SUBOBJECTS": [{"STRING_1": "some_string"}],
+        }
+    )
+
+    assert fast_params.SUBOBJECT.STRING_1 == "SOME_STRING"
+    assert fast_params.LIST_SUBOBJECTS[0].STRING_1 == "SOME_STRING"
+    assert (
+        "(SubObjectWithInit Location: > MockFastParams > LIST_SUBOBJECTS > Element 0"
+        " > SubObjectWithInit)"
+    ) == str(fast_params.LIST_SUBOBJECTS[0])
+
+
+@requires_msgspec
+def test_fast_base_model_subobjects_with_overridden_init_keep_value_types():
+    class SubObjectWithInit(BaseModel):
+        WHEN: datetime.date
+        IDS: tuple[int, ...]
+        NESTED: MockSubObject
+
+        def __init__(self, params_dict, location_tracker="") -> None:
+            super().__init__(params_dict, location_tracker)
+
+    class MockFastParams(FastBaseModel):
+        SUBOBJECT: SubObjectWithInit
+
+    fast_params = MockFastParams(
+        {
+            "SUBOBJECT": {
+                "WHEN": datetime.date(2022, 8, 10),
+                "IDS": (1, 2),
+                "NESTED": {"STRING_1": "some_string"},
+            }
+        }
+    )
+
+    assert fast_params.SUBOBJECT.WHEN == datetime.date(2022, 8, 10)
+    assert fast_params.SUBOBJECT.IDS == (1, 2)
+    assert fast_params.SUBOBJECT.NESTED == MockSubObject({"STRING_1": "some_string"})
+
+
+@requires_msgspec
+def test_fast_base_model_sets_params_from_json_file(params_dict: dict[str, Any]):
+    class MockFastParams(FastBaseModel):
+        TEST_STRING: str
+        TEST_INT: str
+        TEST_DICT: dict
+        TEST_LIST: list[str]
+        TEST_SUBOBJECT: MockSubObject
+
+    params_dict["TEST_STRING"] = "OLD_STRING"
+    fast_params = MockFastParams(params_dict)
+    fast_params.set_params_from_params_json_file("./tests/test_data/mock_params.json")
+
+    assert fast_params.to_dict() == {
+        "TEST_STRING": "TEST_STRING",
+        "TEST_INT": "TEST_INT",
+        "TEST_DICT": {"TEST_DICT_1": "1"},
+        "TEST_LIST": ["1", "2", "3"],
+        "TEST_SUBOBJECT": MockSubObject({"STRING_1": "some_string"}),
+    }
+
+
+@requires_msgspec
+def test_fast_base_model_checks_types(params_dict: dict[str, Any]):
+    class MockFastParams(FastBaseModel):
+        TEST_STRING: str
+        TEST_INT: int
+        TEST_DICT: dict
+        TEST_LIST: list
+        TEST_SUBOBJECT: MockSubObject
+
+    with pytest.raises(ValueError) as err:
+        MockFastParams(params_dict)
+
+    assert "$.TEST_INT" in str(err.value)
+    assert "Location: > MockFastParams" in str(err.value)
+
+
+@requires_msgspec
+def test_fast_base_model_unknown_param_raises_error(params_dict: dict[str, Any]):
+    class MockFastSubObject(FastBaseModel):
+        STRING_1: str
+
+    with pytest.raises(ValueError) as err:
+        MockFastSubObject({"NOT_IN_TYPE_DEFINITION": "some_string"})
+
+    assert "NOT_IN_TYPE_DEFINITION" in str(err.value)
+
+
+@requires_msgspec
+def test_fast_base_model_missing_param_raises_error():
+    class MockFastSubObject(FastBaseModel):
+        STRING_1: str
+        STRING_2: str = "default"
+
+    with pytest.raises(ValueError) as err:
+        MockFastSubObject({})
+
+    assert "STRING_1" in str(err.value)
+    assert MockFastSubObject({"STRING_1": "some_string"}).STRING_2 == "default"
+
+
+@requires_msgspec
+def test_fast_base_model_with_mutable_default():
+    class MockFastParams(FastBaseModel):
+        TEST_LIST: list = [1]
+        TEST_DICT: dict = {"KEY": "VALUE"}
+
+    first_params = MockFastParams({})
+    first_params.TEST_LIST.append(2)
+
+    assert first_params.TEST_DICT == {"KEY": "VALUE"}
+    assert MockFastParams({}).TEST_LIST == [1]
+    assert MockFastParams({"TEST_LIST": [3]}).TEST_LIST == [3]
+
+
+@requires_msgspec
+def test_fast_base_model_with_recursive_type_definition_raises_error():
+    with pytest.raises(TypeError) as err:
+        MockFastTreeNode({"NAME": "root", "CHILDREN": []})
+
+    assert "FastBaseModel does not support recursive type definitions" in str(err.value)
+
+
+@requires_msgspec
+def test_fast_base_model_first_instances_in_threads(monkeypatch):
+    class MockFastSubObject(FastBaseModel):
+        STRING_1: str
+
+    defstruct = typed_params.msgspec.defstruct
+
+    def slow_defstruct(*args, **kwargs):
+        time.sleep(0.1)
+        return defstruct(*args, **kwargs)
+
+    monkeypatch.setattr(typed_params.msgspec, "defstruct", slow_defstruct)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(MockFastSubObject, {"STRING_1": "some_string"})
+            for _ in range(2)
+        ]
+        sub_objects = [future.result() for future in futures]
+
+    assert sub_objects[0] == sub_objects[1]
+
+
+@requires_msgspec
+def test_fast_base_model_with_no_attributes_raises_error():
+    class ClassWithNoAttributes(FastBaseModel):
+        pass
+
+    with pytest.raises(ValueError) as err:
+        ClassWithNoAttributes({})
+
+    assert (
+        "Class definition for ClassWithNoAttributes does not contain any attributes!"
+        in str(err.value)
+    )
+
+
+def test_fast_base_model_without_msgspec_raises_error(monkeypatch):
+    monkeypatch.setattr(typed_params, "msgspec", None)
+
+    with pytest.raises(ImportError) as err:
+
+        class MockFastSubObject(FastBaseModel):
+            STRING_1: str
+
+    assert "msgspec must be installed" in str(err.value)
@@ -1,11 +1,52 @@
-from typing import Any, Union, get_type_hints, get_origin, get_args, Type
+from typing import (
+    Any,
+    ForwardRef,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Union,
+    get_type_hints,
+    get_origin,
+    get_args,
+    Type,
+)
+from copy import deepcopy
+from functools import partial
 from pathlib import Path
+from types import MemberDescriptorType
 import json
+import re
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson cannot hold integers outside 64 bits and may turn them into floats,
+# so any integer with 19 or more digits is parsed with json instead
+_LONG_INTEGER = re.compile(rb"(?<![\d.])-?\d{19,}(?![\d.eE])")
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 def load_params_dict_from_json_file(file_path: Union[str, Path]) -> dict[str, Any]:
-    with open(file_path) as params_file:
-        return json.load(params_file)
+    """
+    Loads a params json file into a dictionary
+    orjson is used for parsing when it is installed, otherwise falls back to json
+    The result is always the same as parsing with json
+    """
+    params_bytes = Path(file_path).read_bytes()
+    if orjson is None or _LONG_INTEGER.search(params_bytes):
+        return json.loads(params_bytes)
+    try:
+        return orjson.loads(params_bytes)
+    except orjson.JSONDecodeError:
+        # orjson rejects NaN and Infinity, which json accepts
+        return json.loads(params_bytes)
 
 
 def raise_error_with_location(
@@ -14,19 +55,210 @@ def raise_error_with_location(
     raise error(f"{error_message} Location:{location}")
 
 
+_KIND_SCALAR = 0
+_KIND_SUBMODEL = 1
+_KIND_LIST_SUBMODEL = 2
+_KIND_DICT_SUBMODEL = 3
+
+
+class _FieldPlan(NamedTuple):
+    """
+    How a single param is converted when it is loaded, worked out once per class
+    """
+
+    name: str
+    kind: int
+    type_origin: Any
+    type_args: tuple[Any, ...]
+    type_hint: Any
+
+
+def _is_base_model_class(type_hint: Any) -> bool:
+    """
+    Type hints such as Union or Any are not classes so cannot be passed to issubclass
+    """
+    return (
+        get_origin(type_hint) is None
+        and isinstance(type_hint, type)
+        and issubclass(type_hint, BaseModel)
+    )
+
+
+def _classify_type(type_origin: Any, type_args: tuple[Any, ...]) -> int:
+    """
+    Works out which kind of conversion a param with this type needs
+    """
+    if _is_base_model_class(type_origin):
+        return _KIND_SUBMODEL
+    if type_origin is list and type_args and _is_base_model_class(type_args[0]):
+        return _KIND_LIST_SUBMODEL
+    if (
+        type_origin is dict
+        and len(type_args) == 2
+        and _is_base_model_class(type_args[1])
+    ):
+        return _KIND_DICT_SUBMODEL
+    return _KIND_SCALAR
+
+
+def _resolve_forward_ref_args(
+    type_hint: Any, global_namespace: dict[str, Any], local_namespace: dict[str, Any]
+) -> Any:
+    """
+    On Python 3.9 and 3.10 get_type_hints leaves forward references inside
+    list and dict type hints unresolved, e.g. list["Node"]
+    Raises NameError if a forward reference is not defined yet
+    """
+    type_origin = get_origin(type_hint)
+    type_args = get_args(type_hint)
+    if type_origin not in (list, dict) or not any(
+        isinstance(type_arg, (str, ForwardRef)) for type_arg in type_args
+    ):
+        return type_hint
+
+    resolved_type_args = []
+    for type_arg in type_args:
+        if isinstance(type_arg, ForwardRef):
+            type_arg = type_arg.__forward_arg__
+        if isinstance(type_arg, str):
+            type_arg = eval(type_arg, global_namespace, local_namespace)
+        resolved_type_args.append(type_arg)
+    return type_origin[tuple(resolved_type_args)]
+
+
+def _build_field_plan(param_name: str, type_hint: Any) -> _FieldPlan:
+    type_origin = get_origin(type_hint)
+    if type_origin is None:
+        type_origin = type_hint
+    type_args = get_args(type_hint)
+    kind = _classify_type(type_origin, type_args)
+    return _FieldPlan(param_name, kind, type_origin, type_args, type_hint)
+
+
+class _FullLocation(str):
+    """
+    A location that was assigned to _location_tracker directly
+    It already includes the class name so is used as it is
+    """
+
+
+def _format_location(
+    location_parent: Union[str, "_SubObjectLocation"], class_name: str
+) -> str:
+    if type(location_parent) is _FullLocation:
+        return str(location_parent)
+    return f"{location_parent} > {class_name}"
+
+
+class _SubObjectLocation(NamedTuple):
+    """
+    The location of a sub-object within its parent
+    This is only formatted into a string when it is needed, e.g. for an error message
+
+    Only the parent's own location and class name are kept rather than the parent,
+    so sub-objects do not keep their parent alive
+    """
+
+    parent_location_parent: Union[str, "_SubObjectLocation"]
+    parent_class_name: str
+    param_name: str = ""
+    key_label: str = ""
+    key: Any = None
+
+    @classmethod
+    def of(
+        cls,
+        parent: "BaseModel",
+        param_name: str = "",
+        key_label: str = "",
+        key: Any = None,
+    ) -> "_SubObjectLocation":
+        return cls(
+            parent._location_parent,
+            type(parent).__name__,
+            param_name,
+            key_label,
+            key,
+        )
+
+    def __str__(self) -> str:
+        parent_location = _format_location(
+            self.parent_location_parent, self.parent_class_name
+        )
+        if not self.key_label:
+            return parent_location
+        return f"{parent_location} > {self.param_name} > {self.key_label} {self.key}"
+
+
 class BaseModel:
-    def __init__(self, params_dict: dict[str, Any], location_tracker: str = "") -> None:
-        location_tracker += f" > {type(self).__name__}"
-        self._location_tracker = location_tracker
+    # Subclasses can declare __slots__ for their attributes to avoid a __dict__
+    __slots__ = ("_location_parent",)
+
+    def __init__(
+        self,
+        params_dict: dict[str, Any],
+        location_tracker: Union[str, _SubObjectLocation] = "",
+    ) -> None:
+        self._location_parent = location_tracker
         self.set_params_from_params_dict(params_dict)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        try:
+            cls._compile_field_plan()
+        except NameError:
+            # Forward references that are not defined yet are resolved
+            # when the class is first instantiated instead
+            pass
+
+    @classmethod
+    def _compile_field_plan(cls) -> None:
+        """
+        Works out how each param should be converted from the type hints
+        so that this does not need to be done for every instance
+        """
+        type_hints_by_param_name = get_type_hints(cls)
+        global_namespace = getattr(sys.modules.get(cls.__module__), "__dict__", {})
+        local_namespace = dict(vars(cls))
+        field_plans = tuple(
+            _build_field_plan(
+                param_name,
+                _resolve_forward_ref_args(type_hint, global_namespace, local_namespace),
+            )
+            for param_name, type_hint in type_hints_by_param_name.items()
+        )
+        cls._FIELD_PLAN = field_plans
+        cls._FIELD_NAMES = frozenset(type_hints_by_param_name)
+        cls._PUBLIC_FIELDS = tuple(type_hints_by_param_name)
+        # Set last, as other threads take _PLAN_BY_NAME to mean the plan is complete
+        cls._PLAN_BY_NAME = {field_plan.name: field_plan for field_plan in field_plans}
+
     def __eq__(self, other: object) -> bool:
         """
         Two instances of BaseModel are equal if:
         - they are of the same type
         - their public facing attributes are the same and have the same values.
         """
-        return type(self) == type(other) and self.to_dict() == other.to_dict()
+        if self is other:
+            return True
+        cls = type(self)
+        if cls is not type(other):
+            return False
+        return all(
+            getattr(self, attribute_name) == getattr(other, attribute_name)
+            for attribute_name in cls._PUBLIC_FIELDS
+        )
+
+    # Params can be changed after they are loaded so instances are not hashable
+    __hash__ = None
+
+    @property
+    def _location_tracker(self) -> str:
+        return _format_location(self._location_parent, type(self).__name__)
+
+    @_location_tracker.setter
+    def _location_tracker(self, location_tracker: str) -> None:
+        self._location_parent = _FullLocation(location_tracker)
 
     def __str__(self) -> str:
         return f"({type(self).__name__} Location:{self._location_tracker})"
@@ -39,9 +271,10 @@ class BaseModel:
         Returns a dict that does not include private attributes
         This does not convert subobjects to dicts even if they extend from BaseModel
         """
-        dict_with_private_variables = vars(self).copy()
-        del dict_with_private_variables["_location_tracker"]
-        return dict_with_private_variables
+        return {
+            attribute_name: getattr(self, attribute_name)
+            for attribute_name in type(self)._PUBLIC_FIELDS
+        }
 
     def set_params_from_params_json_file(self, file_path: Union[str, Path]):
         """
@@ -58,6 +291,54 @@ class BaseModel:
         self._check_params_object_has_all_attributes_in_type_definition()
         self.run_validations()
 
+    @classmethod
+    def _build_many(
+        cls,
+        params_dicts_by_key: Iterable[tuple[Any, dict[str, Any]]],
+        sub_objects: Union[list[Any], dict[Any, Any]],
+        parent: "BaseModel",
+        param_name: str,
+        key_label: str,
+    ) -> Union[list[Any], dict[Any, Any]]:
+        """
+        Creates a sub-object for each params dict in a list or dict of sub-objects
+        This does the same as __init__ but without the extra function calls per item
+
+        sub_objects should already contain every key so it is not resized while filling
+        """
+        location = _SubObjectLocation
+        parent_location_parent = parent._location_parent
+        parent_class_name = type(parent).__name__
+        if (
+            cls.__init__ is not BaseModel.__init__
+            or cls.set_params_from_params_dict
+            is not BaseModel.set_params_from_params_dict
+        ):
+            for key, params_dict in params_dicts_by_key:
+                sub_objects[key] = cls(
+                    params_dict,
+                    location_tracker=location(
+                        parent_location_parent,
+                        parent_class_name,
+                        param_name,
+                        key_label,
+                        key,
+                    ),
+                )
+            return sub_objects
+
+        new = cls.__new__
+        for key, params_dict in params_dicts_by_key:
+            sub_object = new(cls)
+            sub_object._location_parent = location(
+                parent_location_parent, parent_class_name, param_name, key_label, key
+            )
+            sub_object._set_attributes_from_params_dict(params_dict)
+            sub_object._check_params_object_has_all_attributes_in_type_definition()
+            sub_object.run_validations()
+            sub_objects[key] = sub_object
+        return sub_objects
+
     def run_validations(self) -> None:
         """
         This function should be overridden to perform any validations
@@ -69,18 +350,26 @@ class BaseModel:
         """
         This is a private function that sets the params without verification
         """
-        try:
-            type_hints_by_param_name = get_type_hints(self)
-        except TypeError:
+        cls = type(self)
+        if "_PLAN_BY_NAME" not in cls.__dict__:
+            cls._compile_field_plan()
+        plan_by_name = cls._PLAN_BY_NAME
+        if not plan_by_name:
             raise ValueError(
-                f"Class definition for {type(self).__name__} does not contain any attributes!"
+                f"Class definition for {cls.__name__} does not contain any attributes!"
             )
         for param_name, param_value in params_dict.items():
-            self._check_param_being_loaded_is_in_type_definition(param_name)
-            result = self._convert_typed_subparams_to_objects(
-                type_hints_by_param_name, param_name, param_value
-            )
-            setattr(self, param_name, result)
+            field_plan = plan_by_name.get(param_name)
+            if field_plan is None:
+                # This raises unless a subclass overrides it, e.g. to only warn,
+                # in which case the param is not set
+                self._check_param_being_loaded_is_in_type_definition(param_name)
+                continue
+
+            if field_plan.kind == _KIND_SCALAR:
+                setattr(self, param_name, param_value)
+            else:
+                setattr(self, param_name, self._convert_param(field_plan, param_value))
 
     def _convert_typed_subparams_to_objects(
         self,
@@ -97,37 +386,39 @@ class BaseModel:
         param_name: list[SubClassOfBaseModel] -> Will convert each object in the list
                                                  to an instance of SubClassOfBaseModel
         """
-        type_hint = type_hints_by_param_name[param_name]
-        type_origin = get_origin(type_hint)
-        if type_origin is None:
-            type_origin = type_hint
-        type_args = get_args(type_hint)
-
-        result = param_value
+        field_plan = _build_field_plan(param_name, type_hints_by_param_name[param_name])
+        return self._convert_param(field_plan, param_value)
 
-        if issubclass(type_origin, BaseModel):
-            result = type_origin(param_value, location_tracker=self._location_tracker)
-
-        if self._should_do_list_conversion(type_origin, type_args):
-            result = self._do_list_conversion(
-                type_origin, type_args, param_value, param_name
+    def _convert_param(self, field_plan: _FieldPlan, param_value: Any) -> Any:
+        """
+        Converts a param to objects using its precomputed field plan
+        """
+        kind = field_plan.kind
+        if kind == _KIND_SCALAR:
+            return param_value
+        if kind == _KIND_SUBMODEL:
+            return field_plan.type_origin(
+                param_value, location_tracker=_SubObjectLocation.of(self)
             )
-
-        if self._should_do_dict_conversion(type_origin, type_args):
-            result = self._do_dict_conversion(
-                type_origin, type_args, param_value, param_name
+        if kind == _KIND_LIST_SUBMODEL:
+            return self._do_list_conversion(
+                field_plan.type_origin,
+                field_plan.type_args,
+                param_value,
+                field_plan.name,
             )
-        return result
+        return self._do_dict_conversion(
+            field_plan.type_origin, field_plan.type_args, param_value, field_plan.name
+        )
 
     def _should_do_list_conversion(
         self, type_origin: Type[Any], type_args: tuple[Type[Any]]
     ) -> bool:
-        return (
-            type_origin is list
-            and type_args
-            and get_origin(type_args[0]) is None
-            and issubclass(type_args[0], BaseModel)
-        )
+        """
+        Not used when loading params, the field plan already knows which params
+        need converting
+        """
+        return _classify_type(type_origin, type_args) == _KIND_LIST_SUBMODEL
 
     def _do_list_conversion(
         self,
@@ -140,28 +431,26 @@ class BaseModel:
             type_origin is list and type(param_value) is not list
         )
         if type_hint_and_value_do_not_match:
-            raise_error_with_location(
-                ValueError,
-                f"Type hint and value do not match for {param_name} with value {param_value} with type {type(param_value)} should be {type_origin}",
-                self._location_tracker,
-            )
-        return [
-            type_args[0](
-                item,
-                location_tracker=f"{self._location_tracker} > {param_name} > Element {i}",
+            raise ValueError(
+                f"Type hint and value do not match for {param_name} with value {param_value} with type {type(param_value)} should be {type_origin}"
+                f" Location:{self._location_tracker}"
             )
-            for i, item in enumerate(param_value)
-        ]
+        return type_args[0]._build_many(
+            enumerate(param_value),
+            [None] * len(param_value),
+            self,
+            param_name,
+            "Element",
+        )
 
     def _should_do_dict_conversion(
         self, type_origin: Type[Any], type_args: tuple[Type[Any]]
     ) -> bool:
-        return (
-            type_origin is dict
-            and len(type_args) == 2
-            and get_origin(type_args[1]) is None
-            and issubclass(type_args[1], BaseModel)
-        )
+        """
+        Not used when loading params, the field plan already knows which params
+        need converting
+        """
+        return _classify_type(type_origin, type_args) == _KIND_DICT_SUBMODEL
 
     def _do_dict_conversion(
         self,
@@ -174,40 +463,237 @@ class BaseModel:
             type_origin is dict and type(param_value) is not dict
         )
         if type_hint_and_value_do_not_match:
-            raise_error_with_location(
-                ValueError,
-                f"Type hint and value do not match for {param_name} with value {param_value} with type {type(param_value)} should be {type_origin}",
-                self._location_tracker,
-            )
-        return {
-            key: type_args[1](
-                value,
-                location_tracker=f"{self._location_tracker} > {param_name} > Key {key}",
+            raise ValueError(
+                f"Type hint and value do not match for {param_name} with value {param_value} with type {type(param_value)} should be {type_origin}"
+                f" Location:{self._location_tracker}"
             )
-            for key, value in param_value.items()
-        }
+        return type_args[1]._build_many(
+            param_value.items(),
+            dict.fromkeys(param_value),
+            self,
+            param_name,
+            "Key",
+        )
 
     def _check_params_object_has_all_attributes_in_type_definition(self) -> None:
-        for attribute_name in self.__annotations__:
-            if not hasattr(self, attribute_name):
-                raise_error_with_location(
-                    ValueError,
-                    f"""
+        cls = type(self)
+        # Instances of subclasses that declare __slots__ have no __dict__
+        missing_attribute_names = cls._FIELD_NAMES.difference(
+            getattr(self, "__dict__", ())
+        )
+        if not missing_attribute_names:
+            return
+        # hasattr still allows slots and attributes with a default in the class
+        attribute_name = next(
+            (
+                attribute_name
+                for attribute_name in cls._PUBLIC_FIELDS
+                if attribute_name in missing_attribute_names
+                and not hasattr(self, attribute_name)
+            ),
+            None,
+        )
+        if attribute_name is not None:
+            raise ValueError(f"""
 The attribute {attribute_name} is missing from the params object
 Even after the params have been loaded.
 Please check it is in the params.json file you have selected.
-""",
-                    location=self._location_tracker,
-                )
+ Location:{self._location_tracker}""")
 
     def _check_param_being_loaded_is_in_type_definition(self, param_name) -> None:
-        if not (param_name in self.__annotations__):
-            raise_error_with_location(
-                ValueError,
-                f"""
+        if not (param_name in type(self)._FIELD_NAMES):
+            raise ValueError(f"""
 You are trying to set the attribue {param_name} in the Params object, but it is not listed in the Params object.
 Check the params.json file does not have a spelling error.
 If you are adding a new param to the params json, please add a type definition in your Params class.
-""",
-                location=self._location_tracker,
+ Location:{self._location_tracker}""")
+
+
+def _struct_type_for_model(
+    model_cls: Type[BaseModel],
+    classes_being_built: Optional[set[type]] = None,
+) -> type:
+    """
+    Builds a msgspec Struct with the same attributes as a BaseModel subclass
+    Sub-objects are converted to their own Structs, the result is cached on the class
+
+    classes_being_built holds the classes further up this call, to catch recursion
+    """
+    struct_cls = model_cls.__dict__.get("_STRUCT_CLS")
+    if struct_cls is not None:
+        return struct_cls
+
+    if classes_being_built is None:
+        classes_being_built = set()
+    if model_cls in classes_being_built:
+        raise TypeError(
+            f"FastBaseModel does not support recursive type definitions, {model_cls.__name__} refers to itself"
+        )
+
+    if "_PLAN_BY_NAME" not in model_cls.__dict__:
+        model_cls._compile_field_plan()
+    if not model_cls._FIELD_PLAN:
+        raise ValueError(
+            f"Class definition for {model_cls.__name__} does not contain any attributes!"
+        )
+
+    classes_being_built.add(model_cls)
+    struct_fields = []
+    for field_plan in model_cls._FIELD_PLAN:
+        if field_plan.kind == _KIND_SUBMODEL:
+            struct_type = _struct_type_for_model(
+                field_plan.type_origin, classes_being_built
             )
+        elif field_plan.kind == _KIND_LIST_SUBMODEL:
+            struct_type = list[
+                _struct_type_for_model(field_plan.type_args[0], classes_being_built)
+            ]
+        elif field_plan.kind == _KIND_DICT_SUBMODEL:
+            struct_type = dict[
+                field_plan.type_args[0],
+                _struct_type_for_model(field_plan.type_args[1], classes_being_built),
+            ]
+        else:
+            struct_type = field_plan.type_hint
+
+        default = getattr(model_cls, field_plan.name, msgspec.NODEFAULT)
+        if isinstance(default, MemberDescriptorType):
+            # Attributes declared in __slots__ do not have a default
+            default = msgspec.NODEFAULT
+        elif isinstance(default, (list, dict, set, bytearray)):
+            # msgspec does not allow mutable defaults, so each instance gets a copy
+            default = msgspec.field(default_factory=partial(deepcopy, default))
+        struct_fields.append((field_plan.name, struct_type, default))
+    classes_being_built.discard(model_cls)
+
+    struct_cls = msgspec.defstruct(
+        model_cls.__name__,
+        struct_fields,
+        kw_only=True,
+        forbid_unknown_fields=True,
+    )
+    # Only cached once it is complete, so other threads never see a partial Struct.
+    # Two threads may both build it the first time, either result works the same
+    model_cls._STRUCT_CLS = struct_cls
+    return struct_cls
+
+
+def _set_attributes_from_struct(model: BaseModel, struct: Any) -> None:
+    """
+    Copies the values from a msgspec Struct onto a BaseModel
+    Structs for sub-objects are converted into their BaseModel subclass
+    """
+    for field_plan in type(model)._FIELD_PLAN:
+        param_name = field_plan.name
+        value = getattr(struct, param_name)
+        kind = field_plan.kind
+        if kind == _KIND_SUBMODEL:
+            value = _model_from_struct(
+                field_plan.type_origin, value, _SubObjectLocation.of(model)
+            )
+        elif kind == _KIND_LIST_SUBMODEL:
+            value = [
+                _model_from_struct(
+                    field_plan.type_args[0],
+                    item,
+                    _SubObjectLocation.of(model, param_name, "Element", i),
+                )
+                for i, item in enumerate(value)
+            ]
+        elif kind == _KIND_DICT_SUBMODEL:
+            value = {
+                key: _model_from_struct(
+                    field_plan.type_args[1],
+                    item,
+                    _SubObjectLocation.of(model, param_name, "Key", key),
+                )
+                for key, item in value.items()
+            }
+        setattr(model, param_name, value)
+
+
+def _struct_to_params_dict(value: Any) -> Any:
+    """
+    Turns a Struct back into a params dict, keeping every value as msgspec loaded it
+    Only Structs for sub-objects, including those in lists and dicts, become dicts
+    """
+    if isinstance(value, msgspec.Struct):
+        return {
+            field_name: _struct_to_params_dict(getattr(value, field_name))
+            for field_name in value.__struct_fields__
+        }
+    if type(value) is list:
+        return [_struct_to_params_dict(item) for item in value]
+    if type(value) is dict:
+        return {key: _struct_to_params_dict(item) for key, item in value.items()}
+    return value
+
+
+def _model_from_struct(
+    model_cls: Type[BaseModel], struct: Any, location_tracker: _SubObjectLocation
+) -> BaseModel:
+    if not _loads_params_by_default(model_cls):
+        # Classes that override loading are built through __init__ so the override runs
+        return model_cls(
+            _struct_to_params_dict(struct), location_tracker=location_tracker
+        )
+
+    model = model_cls.__new__(model_cls)
+    model._location_parent = location_tracker
+    _set_attributes_from_struct(model, struct)
+    model.run_validations()
+    return model
+
+
+def _loads_params_by_default(model_cls: Type[BaseModel]) -> bool:
+    """
+    Whether a class loads params without overriding __init__ or
+    set_params_from_params_dict, so it can be built straight from a Struct
+    """
+    return model_cls.__init__ is BaseModel.__init__ and (
+        model_cls.set_params_from_params_dict is BaseModel.set_params_from_params_dict
+        or model_cls.set_params_from_params_dict
+        is FastBaseModel.set_params_from_params_dict
+    )
+
+
+class FastBaseModel(BaseModel):
+    """
+    A BaseModel that loads params with msgspec, which parses and checks them in C
+    Unlike BaseModel, the type of every param is checked against its type hint
+    msgspec must be installed to use this class
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        if msgspec is None:
+            raise ImportError(
+                f"msgspec must be installed to use FastBaseModel for {cls.__name__}"
+            )
+        super().__init_subclass__(**kwargs)
+
+    def set_params_from_params_json_file(self, file_path: Union[str, Path]):
+        """
+        Set all params from a json file and verify
+        The file is parsed straight into the msgspec Struct without creating a dict
+        """
+        struct_cls = _struct_type_for_model(type(self))
+        try:
+            struct = msgspec.json.decode(Path(file_path).read_bytes(), type=struct_cls)
+        except msgspec.ValidationError as error:
+            raise ValueError(f"{error} Location:{self._location_tracker}") from error
+        _set_attributes_from_struct(self, struct)
+        self.run_validations()
+
+    def set_params_from_params_dict(self, params_dict: dict[str, Any]) -> None:
+        """
+        This function sets all params from a dictionary and verifies that they are correct
+        """
+        struct_cls = _struct_type_for_model(type(self))
+        try:
+            struct = msgspec.convert(params_dict, type=struct_cls)
+        except msgspec.ValidationError as error:
+            raise ValueError(f"{error} Location:{self._location_tracker}") from error
+        _set_attributes_from_struct(self, struct)
+        self.run_validations()